@@ -2,20 +2,40 @@
 import streamlit as st
 import os
 import pandas as pd
-from langchain_experimental.tools.python.tool import PythonREPLTool
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_experimental.agents import create_pandas_dataframe_agent
 from dotenv import load_dotenv
 load_dotenv()
-from src.fetch_trial import get_trials
-from src.clean_data import clean_trials
-from src.score_sites import compute_scores
-from src.aggregate_sites import normalize_sites
-from src.metrics import compute_match_score, compute_data_quality, compute_performance_metrics
-from src.database import save_to_sqlite
-from src.visualize import plot_distribution, plot_top_sites, plot_top_sites_by_study_count
+from src.jobs import JobRegistry, DONE
 from utils.logger import log 
-import matplotlib.pyplot as plt
+
+# ----------------------------
+# Lazily Loaded Subsystems
+# ----------------------------
+# The LLM agent stack and the plotting backend are the most expensive imports
+# in the app; they are loaded on first use and then held for the whole process
+# so cold starts and reruns that never touch them don't pay for them.
+@st.cache_resource
+def load_plotting():
+    import matplotlib
+    matplotlib.use("Agg")
+    from src import visualize
+    return visualize
+
+
+@st.cache_resource
+def load_llm():
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash-lite",
+        temperature=0.0,
+        max_output_tokens=1024
+    )
+
+
+@st.cache_resource
+def load_agent_factory():
+    from langchain_experimental.agents import create_pandas_dataframe_agent
+    return create_pandas_dataframe_agent
+
 
 # ----------------------------
 # Page Setup
@@ -33,26 +53,56 @@ page_size = st.sidebar.slider("Number of trials to fetch", 10, 100, 50)
 run_button = st.sidebar.button("🚀 Run Analysis")
 
 # ----------------------------
-# Fetch & Process Data
+# Fetch & Process Data (background job)
 # ----------------------------
+@st.cache_resource
+def get_job_registry():
+    return JobRegistry(max_workers=2)
+
+
+jobs = get_job_registry()
+
 if run_button:
-    with st.spinner("Fetching data from ClinicalTrials.gov..."):
-        raw_df = get_trials(term, page_size)
-        st.session_state.raw_df = raw_df
-
-    with st.spinner("Cleaning and scoring data..."):
-        cleaned = clean_trials(raw_df)
-        cleaned = compute_match_score(cleaned)
-        cleaned = compute_data_quality(cleaned)
-        cleaned = compute_performance_metrics(cleaned)
-        cleaned = compute_scores(cleaned)
-        site_summary = normalize_sites(cleaned)
-
-        st.session_state.cleaned = cleaned
-        st.session_state.site_summary = site_summary
-        save_to_sqlite(cleaned, f"{term.lower()}_clinical_sites.db")
-
-    st.success(f"✅ Data fetched and processed successfully for '{term}'")
+    st.session_state.job_id = jobs.submit(term, page_size).id
+
+
+@st.fragment(run_every=1.0 if "job_id" in st.session_state else None)
+def job_status():
+    if "job_id" not in st.session_state:
+        return
+    job = jobs.get(st.session_state.job_id)
+    if job is None:
+        del st.session_state.job_id
+        st.session_state.flash = ("error", "Analysis result is no longer available, please run again.")
+        st.rerun()
+
+    if job.in_flight:
+        st.progress(job.progress, text=f"'{job.term}': {job.stage_label}")
+        if "cleaned" in st.session_state:
+            st.caption("Showing previous results while the new analysis runs.")
+        return
+
+    del st.session_state.job_id
+    if job.status == DONE:
+        st.session_state.raw_df = job.result["raw_df"]
+        st.session_state.cleaned = job.result["cleaned"]
+        st.session_state.site_summary = job.result["site_summary"]
+        st.session_state.result_term = job.term
+        st.session_state.flash = ("success", f"✅ Data fetched and processed successfully for '{job.term}'")
+    else:
+        st.session_state.flash = ("error", f"Analysis for '{job.term}' failed: {job.error}")
+    st.rerun()
+
+
+job_status()
+
+if st.session_state.get("flash"):
+    kind, msg = st.session_state.flash
+    if kind == "success":
+        st.success(msg)
+    else:
+        st.error(msg)
+    st.session_state.flash = None
 # ----------------------------
 # 🧠 Chat Agent Tab
 # ----------------------------
@@ -62,6 +112,7 @@ if run_button:
 if "cleaned" in st.session_state:
     cleaned = st.session_state.cleaned
     site_summary = st.session_state.site_summary
+    term = st.session_state.get("result_term", term)
 
     # ----------------------------
     # 🧠 Toggle Chatbot Panel
@@ -100,11 +151,8 @@ if "cleaned" in st.session_state:
 
             if user_question:
                 with st.spinner("Analyzing..."):
-                    llm = ChatGoogleGenerativeAI(
-                        model="gemini-2.5-flash-lite",
-                        temperature=0.0,
-                        max_output_tokens=1024
-                    )
+                    llm = load_llm()
+                    create_pandas_dataframe_agent = load_agent_factory()
                     df_to_query = cleaned if choice == "Trials" else site_summary
                     prefix_text = (
 "You are a data analysis expert working with a Pandas DataFrame named df. "
@@ -149,6 +197,7 @@ if "cleaned" in st.session_state:
     # 🏠 Main Dashboard Tabs
     # ----------------------------
     with main_col:
+        viz = load_plotting()
         tab1, tab2, tab3, tab4 = st.tabs(["🏠 Overview", "🏥 Sites", "📊 Metrics", "📄 Data"])
 
         # ---- Overview Tab ----
@@ -167,10 +216,10 @@ if "cleaned" in st.session_state:
             - **Low performance** may signal recruitment or management gaps.
             """)
 
-            fig1 = plot_top_sites(cleaned, n=10)
+            fig1 = viz.plot_top_sites(cleaned, n=10)
             st.pyplot(fig1)
 
-            fig2 = plot_distribution(cleaned)
+            fig2 = viz.plot_distribution(cleaned)
             st.pyplot(fig2)
 
         # ---- Sites Tab ----
@@ -178,7 +227,7 @@ if "cleaned" in st.session_state:
             st.subheader("🏥 Site-Level Performance")
             col1, col2 = st.columns(2)
             with col1:
-                fig3 = plot_top_sites_by_study_count(site_summary)
+                fig3 = viz.plot_top_sites_by_study_count(site_summary)
                 st.pyplot(fig3)
             with col2:
                 st.dataframe(site_summary.head(20), use_container_width=True)
@@ -0,0 +1,147 @@
+# benchmarks/bench_startup.py
+"""Regression benchmark for dashboard cold start and per-rerun overhead.
+
+Each sample starts a fresh interpreter and runs app1.py through Streamlit's
+AppTest harness:
+
+- cold start: imports + first script run on an empty page
+- rerun: further reruns of the empty page in the same process
+- rerun with results: reruns after session state is seeded with the dengue
+  fixture in data/, so the dashboard tabs, charts and plotting loader run
+
+Medians are compared with benchmarks/startup_baseline.json and the script
+exits with status 1 if any of them regressed by more than the allowed
+tolerance, or if a heavy subsystem was imported on the empty page.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --update-baseline
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "startup_baseline.json")
+METRICS = ("cold_start_s", "rerun_s", "rerun_with_results_s")
+
+SAMPLE_CODE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+cold = time.perf_counter() - start
+if at.exception:
+    sys.exit(f"app1.py raised: {{at.exception[0].message}}")
+heavy = ["matplotlib", "langchain_google_genai", "langchain_experimental"]
+eager = [m for m in heavy if m in sys.modules]
+
+def timed_reruns():
+    times = []
+    for _ in range({reruns}):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    if at.exception:
+        sys.exit(f"app1.py raised: {{at.exception[0].message}}")
+    return times
+
+reruns = timed_reruns()
+
+import pandas as pd
+cleaned = pd.read_csv("data/dengue_trials_scored.csv")
+at.session_state["raw_df"] = cleaned
+at.session_state["cleaned"] = cleaned
+at.session_state["site_summary"] = pd.read_csv("data/dengue_site_summary.csv")
+at.session_state["result_term"] = "dengue"
+at.run()  # first run with results loads the plotting backend; not timed
+reruns_with_results = timed_reruns()
+
+print(json.dumps({{
+    "cold_start_s": cold,
+    "rerun_s": reruns,
+    "rerun_with_results_s": reruns_with_results,
+    "eager_heavy_imports": eager,
+}}))
+"""
+
+
+def run_sample(app: str, reruns: int) -> dict:
+    """Measure one cold start and two sets of ``reruns`` reruns in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-c", SAMPLE_CODE.format(app=app, reruns=reruns)],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or "benchmark sample failed")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(app: str, samples: int, reruns: int) -> dict:
+    results = [run_sample(app, reruns) for _ in range(samples)]
+    return {
+        "cold_start_s": statistics.median(r["cold_start_s"] for r in results),
+        "rerun_s": statistics.median(t for r in results for t in r["rerun_s"]),
+        "rerun_with_results_s": statistics.median(t for r in results for t in r["rerun_with_results_s"]),
+        "eager_heavy_imports": sorted({m for r in results for m in r["eager_heavy_imports"]}),
+    }
+
+
+def check_regression(current: dict, baseline: Optional[dict], tolerance: float) -> list:
+    """Return a list of failure messages (empty if nothing regressed)."""
+    failures = []
+    if current["eager_heavy_imports"]:
+        failures.append("heavy subsystems imported on a plain page load: "
+                        + ", ".join(current["eager_heavy_imports"]))
+    if baseline is None:
+        return failures
+    for key in METRICS:
+        limit = baseline[key] * (1 + tolerance)
+        if current[key] > limit:
+            failures.append(f"{key}: {current[key]:.3f}s exceeds {limit:.3f}s "
+                            f"(baseline {baseline[key]:.3f}s + {tolerance:.0%})")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", default="app1.py", help="Streamlit script to benchmark, relative to the repo root")
+    parser.add_argument("--samples", type=int, default=5, help="fresh interpreters to start")
+    parser.add_argument("--reruns", type=int, default=5, help="reruns measured per interpreter")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    current = run_benchmark(args.app, args.samples, args.reruns)
+    print(f"Cold start (median):         {current['cold_start_s']:.3f}s")
+    print(f"Rerun (median):              {current['rerun_s'] * 1000:.1f} ms")
+    print(f"Rerun with results (median): {current['rerun_with_results_s'] * 1000:.1f} ms")
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump({k: current[k] for k in METRICS}, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+
+    baseline = None
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    else:
+        print("No baseline found; only checking for eager heavy imports. "
+              "Run with --update-baseline to record timings.")
+    failures = check_regression(current, baseline, args.tolerance)
+    for msg in failures:
+        print(f"REGRESSION {msg}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# file: src/jobs.py
+"""Background execution of the analysis pipeline.
+
+The dashboard submits jobs to a process-wide ``JobRegistry``. Jobs run on a
+small thread pool so the Streamlit script never blocks, identical in-flight
+requests (same term and parameters) share one job, and each job exposes its
+current stage so the UI can poll progress.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from src.fetch_trial import get_trials
+from src.clean_data import clean_trials
+from src.score_sites import compute_scores
+from src.aggregate_sites import normalize_sites
+from src.metrics import compute_match_score, compute_data_quality, compute_performance_metrics
+from src.database import save_to_sqlite
+
+
+# (stage name, label shown in the UI) in execution order
+PIPELINE_STAGES = [
+    ("fetch", "Fetching data from ClinicalTrials.gov..."),
+    ("clean", "Cleaning data..."),
+    ("score", "Scoring trials..."),
+    ("aggregate", "Aggregating sites..."),
+    ("save", "Saving to SQLite..."),
+]
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def job_key(term: str, page_size: int) -> Tuple[str, int]:
+    """Return the deduplication key for a pipeline request."""
+    return (term.strip().lower(), int(page_size))
+
+
+def run_pipeline(term: str, page_size: int,
+                 on_stage: Optional[Callable[[str], None]] = None) -> dict:
+    """Run fetch, clean, score, aggregate and save for ``term``.
+
+    ``on_stage`` is called with the stage name before each stage starts.
+    Returns a dict with ``raw_df``, ``cleaned`` and ``site_summary``.
+    """
+    def stage(name):
+        if on_stage is not None:
+            on_stage(name)
+
+    stage("fetch")
+    raw_df = get_trials(term, page_size)
+
+    stage("clean")
+    cleaned = clean_trials(raw_df)
+
+    stage("score")
+    cleaned = compute_match_score(cleaned)
+    cleaned = compute_data_quality(cleaned)
+    cleaned = compute_performance_metrics(cleaned)
+    cleaned = compute_scores(cleaned)
+
+    stage("aggregate")
+    site_summary = normalize_sites(cleaned)
+
+    stage("save")
+    save_to_sqlite(cleaned, f"{term.lower()}_clinical_sites.db")
+
+    return {"raw_df": raw_df, "cleaned": cleaned, "site_summary": site_summary}
+
+
+class Job:
+    """State of a single pipeline run, updated from the worker thread."""
+
+    def __init__(self, term: str, page_size: int):
+        self.id = uuid.uuid4().hex
+        self.term = term
+        self.page_size = page_size
+        self.key = job_key(term, page_size)
+        self.status = PENDING
+        self.stage = None
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+
+    @property
+    def in_flight(self) -> bool:
+        return self.status in (PENDING, RUNNING)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of stages started or completed, 0-1."""
+        if self.status == DONE:
+            return 1.0
+        names = [name for name, _ in PIPELINE_STAGES]
+        if self.stage not in names:
+            return 0.0
+        return names.index(self.stage) / len(names)
+
+    @property
+    def stage_label(self) -> str:
+        if self.status == PENDING:
+            return "Waiting for a free worker..."
+        return dict(PIPELINE_STAGES).get(self.stage, "")
+
+    def _set_stage(self, name: str) -> None:
+        self.stage = name
+
+
+class JobRegistry:
+    """Thread-pool executor plus a registry of submitted jobs.
+
+    - max_workers: number of pipelines allowed to run concurrently
+    - keep_finished: finished jobs retained for lookup before pruning
+    """
+
+    def __init__(self, max_workers: int = 2, keep_finished: int = 20):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._in_flight: Dict[Tuple[str, int], Job] = {}
+        self._keep_finished = keep_finished
+
+    def submit(self, term: str, page_size: int) -> Job:
+        """Start a pipeline run, or return the in-flight job for the same request."""
+        key = job_key(term, page_size)
+        with self._lock:
+            existing = self._in_flight.get(key)
+            if existing is not None:
+                return existing
+
+            job = Job(term, page_size)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job
+            self._prune()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job) -> None:
+        job.status = RUNNING
+        try:
+            result = run_pipeline(job.term, job.page_size, on_stage=job._set_stage)
+            error = None
+        except Exception as e:
+            print(f" Pipeline job for '{job.term}' failed: {e}")
+            result, error = None, str(e)
+
+        # finished_at must be set before status leaves RUNNING so _prune never
+        # sees a finished job without a completion time
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        job.status = DONE if error is None else FAILED
+        with self._lock:
+            if self._in_flight.get(job.key) is job:
+                del self._in_flight[job.key]
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond ``keep_finished``. Caller holds the lock."""
+        finished = sorted(
+            (j for j in self._jobs.values() if not j.in_flight and j.finished_at is not None),
+            key=lambda j: j.finished_at,
+        )
+        for job in finished[:max(0, len(finished) - self._keep_finished)]:
+            del self._jobs[job.id]
@@ -0,0 +1,82 @@
+# tests/test_jobs.py
+import threading
+import time
+
+import pytest
+
+import src.jobs as jobs
+from src.jobs import DONE, FAILED, JobRegistry
+
+
+def wait_for(job, timeout=5.0):
+    deadline = time.time() + timeout
+    while job.in_flight:
+        if time.time() > deadline:
+            raise TimeoutError(f"job {job.id} still {job.status}")
+        time.sleep(0.01)
+    return job
+
+
+@pytest.fixture
+def release(monkeypatch):
+    """Stub run_pipeline so jobs block until the returned event is set."""
+    event = threading.Event()
+
+    def fake_pipeline(term, page_size, on_stage=None):
+        if on_stage is not None:
+            on_stage("fetch")
+        assert event.wait(5.0)
+        if term == "boom":
+            raise ValueError("pipeline exploded")
+        return {"term": term, "page_size": page_size}
+
+    monkeypatch.setattr(jobs, "run_pipeline", fake_pipeline)
+    return event
+
+
+def test_identical_in_flight_submits_share_a_job(release):
+    registry = JobRegistry()
+    first = registry.submit("dengue", 50)
+    assert registry.submit("Dengue ", 50) is first
+    assert registry.submit("dengue", 20) is not first
+
+    release.set()
+    assert wait_for(first).status == DONE
+    assert first.result == {"term": "dengue", "page_size": 50}
+
+
+def test_submit_after_completion_starts_new_job(release):
+    registry = JobRegistry()
+    release.set()
+    first = wait_for(registry.submit("dengue", 50))
+
+    second = registry.submit("dengue", 50)
+    assert second is not first
+    assert wait_for(second).status == DONE
+    assert registry.get(first.id) is first
+
+
+def test_failing_pipeline_marks_job_failed(release):
+    registry = JobRegistry()
+    release.set()
+    job = wait_for(registry.submit("boom", 50))
+
+    assert job.status == FAILED
+    assert job.error == "pipeline exploded"
+    assert job.result is None
+    assert job.finished_at is not None
+    assert registry._in_flight == {}
+
+
+def test_keep_finished_prunes_oldest_jobs(release):
+    registry = JobRegistry(max_workers=1, keep_finished=2)
+    release.set()
+    finished = [wait_for(registry.submit("dengue", size)) for size in (10, 20, 30)]
+
+    # pruning runs on submit; the in-flight job is never counted
+    latest = registry.submit("dengue", 40)
+    assert registry.get(finished[0].id) is None
+    assert registry.get(finished[1].id) is finished[1]
+    assert registry.get(finished[2].id) is finished[2]
+    assert registry.get(latest.id) is latest
+    wait_for(latest)
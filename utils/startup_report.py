@@ -0,0 +1,122 @@
+# utils/startup_report.py
+"""Break down dashboard import cost by module using ``python -X importtime``.
+
+The import statements are read from app1.py itself: module-level imports are
+what every cold start pays, imports inside functions are the lazily loaded
+subsystems.
+
+Usage:
+    python -m utils.startup_report            # app1.py module-level imports
+    python -m utils.startup_report --lazy     # plus the lazily loaded subsystems
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app1.py")
+
+
+def collect_imports(path: str = APP_PATH) -> tuple:
+    """Return (startup, lazy) lists of import nodes found in ``path``.
+
+    startup holds the module-level ``import``/``from ... import`` statements,
+    lazy the ones nested inside function bodies.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    startup = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    lazy = []
+    for func in ast.walk(tree):
+        if isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            lazy.extend(node for node in ast.walk(func) if isinstance(node, (ast.Import, ast.ImportFrom)))
+    return startup, lazy
+
+
+def imported_modules(nodes: list) -> list:
+    """Module names an import node may load (``from a import b`` yields ``a`` and ``a.b``)."""
+    modules = []
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        else:
+            modules.append(node.module)
+            modules.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def parse_importtime(stderr: str) -> list:
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us) tuples."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((name.strip(), int(self_us), int(cum_us)))
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_imports(nodes: list) -> list:
+    """Run the import statements in a fresh interpreter and return the parsed timings."""
+    code = "\n".join(ast.unparse(node) for node in nodes)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Running app1.py imports failed: {tail[0]}")
+    return parse_importtime(proc.stderr)
+
+
+def summarize(rows: list, modules: list) -> dict:
+    """Return total time, self time per top-level package and cumulative time per requested module."""
+    by_package = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    requested = {}
+    for name, _, cum_us in rows:
+        if name in modules:
+            requested[name] = cum_us
+
+    return {
+        "total_us": sum(by_package.values()),
+        "by_package": dict(sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)),
+        "requested": requested,
+    }
+
+
+def print_report(summary: dict, top: int = 15) -> None:
+    print(f"Total import time: {summary['total_us'] / 1000:.1f} ms\n")
+
+    print("app1.py imports (cumulative, first import only):")
+    for name, us in summary["requested"].items():
+        print(f"  {name:<35} {us / 1000:>9.1f} ms")
+
+    print(f"\nTop {top} packages by self time:")
+    for name, us in list(summary["by_package"].items())[:top]:
+        share = 100 * us / summary["total_us"] if summary["total_us"] else 0.0
+        print(f"  {name:<35} {us / 1000:>9.1f} ms  {share:5.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lazy", action="store_true", help="also import the lazily loaded subsystems")
+    parser.add_argument("--top", type=int, default=15, help="number of packages to list")
+    args = parser.parse_args(argv)
+
+    startup, lazy = collect_imports()
+    nodes = startup + (lazy if args.lazy else [])
+    print_report(summarize(measure_imports(nodes), imported_modules(nodes)), top=args.top)
+
+
+if __name__ == "__main__":
+    main()